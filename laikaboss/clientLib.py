@@ -30,6 +30,11 @@ import traceback
 import uuid
 from laikaboss.objectmodel import QuitScanException
 from copy import deepcopy as clone_object
+try:
+    import orjson
+    has_orjson = True
+except ImportError:
+    has_orjson = False
 
 REQ_TYPE_PICKLE = b'1'
 REQ_TYPE_PICKLE_ZLIB = b'2'
@@ -114,40 +119,59 @@ def get_scanObjectUID(scanObject):
     '''
     return scanObject.uuid
 
-def getJSON(result):
+def _buildResultDict(result):
     '''
-    This function takes the result of a scan, and returns the JSON output.
+    Build the log record for a scan result as a plain dictionary. This is the
+    internal workhorse behind getJSON; callers that want to inspect the record
+    can use it directly and skip the JSON encode/decode roundtrip.
 
     Arguments:
     result -- a fully populated scan result set.
 
     Returns:
-    A string representation of the json formatted output.
+    A dictionary containing the log record for the result.
     '''
-    resultText = ''
-
     # Build the results portion of the log record. This will be a list of
     # dictionaries, where each dictionary is the result of a single buffer's
     # scan. The list will contain all of the buffers that were exploded from
     # a root buffer's scan in the order they were processed.
     buffer_results = [None] * len(result.files)
     for scan_object in result.files.values():
-        # Do not damage the original result -> clone
-        buffer_result = clone_object(scan_object.__dict__)
         # Don't log buffers here, just metadata
+        buffer_result = scan_object.asDict()
         if "buffer" in buffer_result:
             del buffer_result["buffer"]
+        # Do not damage the original result -> clone (after dropping the
+        # buffer so it isn't needlessly copied)
+        buffer_result = clone_object(buffer_result)
         buffer_results[buffer_result["order"]] = buffer_result
 
     # Construct the log record with fields useful for log processing and
     # routing
-    log_record = {
+    return {
         'source': result.source,
         'scan_result': buffer_results
     }
 
-    resultText = json.dumps(log_record)
-    return resultText
+def getJSON(result):
+    '''
+    This function takes the result of a scan, and returns the JSON output.
+
+    Arguments:
+    result -- a fully populated scan result set.
+
+    Returns:
+    A string representation of the json formatted output.
+    '''
+    record = _buildResultDict(result)
+    if has_orjson:
+        try:
+            return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            # orjson serializes fewer types than the stdlib (e.g. no tuple
+            # dict keys); fall back rather than fail the log record
+            pass
+    return json.dumps(record)
 
 class Client(object):
     _CONTEXT = None
@@ -41,6 +41,10 @@ defaults = {
 
 globals().update(defaults)
 
+# Bumped on every init() so callers caching lookups against this module
+# (e.g. util.get_option) can tell when their cached values went stale
+generation = 0
+
 def _ConfigSectionMap(section):
     dict1 = {}
     try:
@@ -71,7 +75,9 @@ def _map_to_globals(dictionary):
             globals()['%s' % (base,)] = '%s' % (value,)
 
 def init(path):
+    global generation
     logging.debug("Initializing with config: %s" % (path))
+    generation += 1
     Config.read(path)
 
     _map_to_globals(_ConfigSectionMap('DEFAULT'))
@@ -195,7 +195,7 @@ def parse_log_record(result, extended=False):
     doc_hash = None
     for scan_object in result.files.values():
         # Do not damage the original result -> clone
-        buffer_result = clone_object(scan_object.__dict__)
+        buffer_result = clone_object(scan_object.asDict())
 
         if not doc_hash and scan_object.order == 0:
             # TODO: SHA256 is stored in scan result. No need to recalculate
@@ -108,11 +108,12 @@ class LOG_FLUENT(SI_MODULE):
         # a root buffer's scan in no particular order.
         buffer_results = []
         for scan_object in result.files.values():
-            # Do not damage the original result -> clone
-            buffer_result = clone_object(scan_object.__dict__)
             # Don't log buffers here, just metadata
+            buffer_result = scan_object.asDict()
             if "buffer" in buffer_result:
                 del buffer_result["buffer"]
+            # Do not damage the original result -> clone
+            buffer_result = clone_object(buffer_result)
             buffer_results.append(buffer_result)
 
         # Construct the log record with fields useful for log processing and
@@ -130,7 +130,7 @@ class META_SCANINFO(SI_MODULE):
 
         # write extra summary logs
         # format is uuid|runtime|filetype|rootobjectsize|numerrors|source|flags
-        root = scanObject.__dict__
+        root = scanObject.asDict()
         parent_order = root.get('parent_order', 0)
 
         if parent_order == -1:
@@ -19,34 +19,76 @@
 from laikaboss.constants import level_minimal, level_metadata
 import logging
 import base64
+import sys
+from functools import lru_cache
 import time
 import uuid
 import json
 
-# Metadata, etc. is always stored directly as unicode
-def convertToUTF8(thing):
+# Optional fast JSON encoder for the serialize paths; stdlib json remains
+# the fallback
+try:
+    import orjson
+    has_orjson = True
+except ImportError:
+    has_orjson = False
+
+# Short metadata values (module names, mime types, flag tokens, hex hashes)
+# repeat constantly across scans; cache their decoded form so the repeat
+# case is a dict hit instead of a fresh decode + allocation
+@lru_cache(maxsize=4096)
+def _decodeSmallBytes(thing):
+    return thing.decode("utf-8", "replace")
+
+
+def _decodeBytes(thing):
+    if len(thing) <= 64:
+        return _decodeSmallBytes(thing)
+    # bytes.decode goes straight to the C codec (with its internal ASCII
+    # fast path) instead of routing through the str() constructor
+    return thing.decode("utf-8", "replace")
+
+
+def _identity(thing):
+    return thing
+
+
+# Exact-type dispatch table for leaf values. A dict lookup on type() is one
+# hash probe, where the old isinstance ladder walked the MRO for every leaf.
+# Subclasses miss the table and fall through to the isinstance chain below.
+def _uuidToStr(thing):
+    # Inline of uuid.UUID.__str__: slice the hex form directly instead of
+    # going through str() -> __str__ -> %-formatting for every UUID leaf
+    h = thing.hex
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+_CONVERTERS = {
+    bytes: _decodeBytes,
+    str: _identity,
+    bool: _identity,
+    int: _identity,
+    float: _identity,
+    complex: _identity,
+    uuid.UUID: _uuidToStr,
+}
+
+_CONTAINER_TYPES = (list, set, frozenset, tuple, dict)
+
+# Sentinel distinguishing "key absent" from stored falsy values
+_MISSING = object()
+
+
+def _convertLeaf(thing):
+    converter = _CONVERTERS.get(type(thing))
+    if converter is not None:
+        return converter(thing)
+    # Slow path for subclasses and anything else, mirroring the original
+    # isinstance ladder
     if isinstance(thing, bytes):
-        new_str = str(thing, "utf-8", errors="replace")
-        return new_str
+        return thing.decode("utf-8", "replace")
     elif isinstance(thing, str):
         return str(thing)
-    elif isinstance(thing, (list, set, frozenset)):
-        new_obj = []
-        for o in thing:
-            new_obj.append(convertToUTF8(o))
-        return new_obj
-    elif isinstance(thing, tuple):
-        new_tuple = ()
-        for o in thing:
-            new_tuple += (convertToUTF8(o), )
-        return new_tuple
-    elif isinstance(thing, dict):
-        new_obj = {}
-        for key, value in thing.items():
-            new_key = cleanKey(key)
-            new_val = convertToUTF8(value)
-            new_obj[new_key] = new_val
-        return new_obj
     elif isinstance(thing, bool):
         return thing
     elif isinstance(thing, (int, float, complex)):
@@ -59,9 +101,105 @@ def convertToUTF8(thing):
         return str(repr(thing))
 
 
+def _sameContents(new_obj, orig):
+    """True if every element of new_obj is the same object as in orig."""
+    for a, b in zip(new_obj, orig):
+        if a is not b:
+            return False
+    return True
+
+
+def _sameItems(new_obj, orig):
+    """True if every key and value of new_obj is the same object as in orig."""
+    for (new_key, new_val), (old_key, old_val) in zip(new_obj.items(), orig.items()):
+        if new_key is not old_key or new_val is not old_val:
+            return False
+    return True
+
+
+# Metadata, etc. is always stored directly as unicode
+#
+# With reuse_clean=True, containers whose contents came through conversion
+# untouched are returned as-is instead of being copied. Callers that
+# serialize the result and throw it away (the encode paths) use this to
+# skip re-materializing metadata that was already converted when it was
+# added; callers that store the result must keep the default so stored
+# metadata never aliases caller-owned containers.
+def convertToUTF8(thing, reuse_clean=False):
+    if not isinstance(thing, _CONTAINER_TYPES):
+        return _convertLeaf(thing)
+
+    # Iterative walk over nested containers: each stack entry is the slot
+    # (parent container + key/index) a pending container should be written
+    # into. Leaves are converted inline, so the stack only ever holds
+    # containers and the walk never recurses into Python frames.
+    root = [None]
+    stack = [(root, 0, thing)]
+    # (parent, slot, placeholder, original) for containers that need a
+    # finalize pass: tuples are staged as lists, and in reuse mode every
+    # container is revisited to see if the original can be kept
+    pending = []
+    while stack:
+        parent, slot, value = stack.pop()
+        if isinstance(value, (list, set, frozenset)):
+            new_obj = [None] * len(value)
+            parent[slot] = new_obj
+            if reuse_clean:
+                pending.append((parent, slot, new_obj, value))
+            for i, o in enumerate(value):
+                if isinstance(o, _CONTAINER_TYPES):
+                    stack.append((new_obj, i, o))
+                else:
+                    new_obj[i] = _convertLeaf(o)
+        elif isinstance(value, tuple):
+            new_obj = [None] * len(value)
+            parent[slot] = new_obj
+            pending.append((parent, slot, new_obj, value))
+            for i, o in enumerate(value):
+                if isinstance(o, _CONTAINER_TYPES):
+                    stack.append((new_obj, i, o))
+                else:
+                    new_obj[i] = _convertLeaf(o)
+        elif isinstance(value, dict):
+            new_obj = {}
+            parent[slot] = new_obj
+            if reuse_clean:
+                pending.append((parent, slot, new_obj, value))
+            for key, val in value.items():
+                new_key = cleanKey(key)
+                if isinstance(val, _CONTAINER_TYPES):
+                    new_obj[new_key] = None
+                    stack.append((new_obj, new_key, val))
+                else:
+                    new_obj[new_key] = _convertLeaf(val)
+        else:
+            parent[slot] = _convertLeaf(value)
+
+    # Deeper containers were discovered later, so walking in reverse
+    # finalizes children before the containers that hold them; that way a
+    # parent's identity check sees its children's final values
+    for parent, slot, new_obj, orig in reversed(pending):
+        if isinstance(orig, tuple):
+            if reuse_clean and _sameContents(new_obj, orig):
+                parent[slot] = orig
+            else:
+                parent[slot] = tuple(new_obj)
+        elif isinstance(orig, dict):
+            if len(new_obj) == len(orig) and _sameItems(new_obj, orig):
+                parent[slot] = orig
+        elif isinstance(orig, list):
+            if _sameContents(new_obj, orig):
+                parent[slot] = orig
+        # sets/frozensets always convert to a fresh list
+
+    return root[0]
+
+
 # Utility function to (conditionally) convert a unicode buffer to UTF-8
 # Note that str is a unicode type with "from builtins import str"
 def ensureNotUnicode(buffer):
+    if type(buffer) is bytes:
+        return buffer
     if isinstance(buffer, str):
         return buffer.encode("utf-8")
     else:
@@ -71,6 +209,16 @@ def ensureNotUnicode(buffer):
 # Utility function to make sure the buffer is a bytestring and not None
 # (or whatever other weirdness comes through)
 def ensureBytes(child_buffer):
+    # Exact-type checks first: bytes and str cover virtually every caller,
+    # and type() is a tag compare where isinstance walks the MRO
+    t = type(child_buffer)
+    if t is bytes:
+        return child_buffer
+    if t is str:
+        return child_buffer.encode("utf-8")
+    if t is bytearray or t is memoryview:
+        return bytes(child_buffer)
+
     # buffers and bytearrays can be cast to bytes
     try:
         if isinstance(child_buffer, memoryview) or isinstance(child_buffer, bytearray):
@@ -88,13 +236,25 @@ def ensureBytes(child_buffer):
     return child_buffer
 
 
+# Characters not allowed in metadata keys, each replaced with "_";
+# str.translate walks the key once in C instead of one pass per character
+_CLEAN_KEY_TABLE = str.maketrans({"\0": "_", ".": "_", "$": "_"})
+
+
 def cleanKey(key):
-    bad_chars = ["\0", ".", "$"]
     new_key = convertToUTF8(key)
 
     if isinstance(new_key, str):  # For now, allow keys to be booleans or integers
-        for c in bad_chars:
-            new_key = new_key.replace(c, "_")
+        cleaned = new_key.translate(_CLEAN_KEY_TABLE)
+        # translate always builds a new string; keep the original object when
+        # nothing changed so already-clean keys stay identity-comparable.
+        # Intern the result either way: metadata keys ("md5", "filename",
+        # ...) recur across every scan, and interned keys make dict lookups
+        # a pointer comparison instead of a character compare.
+        if cleaned != new_key:
+            new_key = sys.intern(cleaned)
+        else:
+            new_key = sys.intern(new_key)
 
     return new_key
 
@@ -123,7 +283,51 @@ class GlobalModuleTimeoutError(ScanError):
     pass
 
 
+# Every field a ScanObject carries, in the order __init__ assigns them;
+# doubles as the class's __slots__ and as the full serialization field list
+_SCAN_OBJECT_FIELDS = (
+    "contentType",
+    "fileType",
+    "scanModules",
+    "flags",
+    "objectHash",
+    "buffer",
+    "objectSize",
+    "filename",
+    "ephID",
+    "uniqID",
+    "uuid",
+    "parent",
+    "parent_order",
+    "sourceModule",
+    "source",
+    "moduleMetadata",
+    "level",
+    "depth",
+    "order",
+    "rootUID",
+    "origRootUID",
+    "charset",
+    "scanTime",
+)
+
+# Fields included per serialization level; any other level serializes the
+# full field list
+_SCAN_OBJECT_SERIALIZE_FIELDS = {
+    level_minimal: tuple(
+        f for f in _SCAN_OBJECT_FIELDS if f not in ("buffer", "moduleMetadata")
+    ),
+    level_metadata: tuple(f for f in _SCAN_OBJECT_FIELDS if f != "buffer"),
+}
+
+
 class ScanObject(object):
+    # Slots save the per-instance __dict__ (~150 bytes each) and make
+    # attribute access a fixed-offset load; every field is assigned in
+    # __init__ so nothing is ever missing. Flags are stored in a private
+    # set (exposed through the sorted `flags` property below).
+    __slots__ = tuple(f if f != "flags" else "_flags" for f in _SCAN_OBJECT_FIELDS)
+
     def __init__(
         self,
         objectHash="",
@@ -149,7 +353,7 @@ class ScanObject(object):
         self.contentType = convertToUTF8(contentType)
         self.fileType = fileType
         self.scanModules = []
-        self.flags = []
+        self._flags = set()
         self.objectHash = objectHash
         self.buffer = ensureBytes(buffer)
         self.objectSize = objectSize
@@ -170,11 +374,28 @@ class ScanObject(object):
         self.charset = charset
         self.scanTime = int(time.time())
 
+    # Flags are kept in a set so addFlag dedup is O(1) instead of a list
+    # membership scan; the property presents them in sorted order so logs
+    # and serialized results stay deterministic
+    @property
+    def flags(self):
+        return sorted(self._flags)
+
+    @flags.setter
+    def flags(self, value):
+        self._flags = set(value)
+
+    # Read-only view over the buffer: slicing a memoryview is zero-copy,
+    # so modules carving regions out of large objects can use
+    # scanObject.buffer_view[offset:offset + n] without duplicating bytes.
+    # The buffer attribute itself stays plain bytes for compatibility.
+    @property
+    def buffer_view(self):
+        return memoryview(self.buffer)
+
     # Wrapper function to add flags to the object
     def addFlag(self, flag):
-        flag = convertToUTF8(flag)
-        if flag not in self.flags:
-            self.flags.append(flag)
+        self._flags.add(convertToUTF8(flag))
 
     # Wrapper function for adding metadata to the object
     def addMetadata(self, moduleName, key, value, unique=False, maxlen=0):
@@ -192,42 +413,43 @@ class ScanObject(object):
                 pass
 
         # If no metadata exists for this module yet, add a new dictionary with the key/value pair
-        if moduleName not in self.moduleMetadata:
+        module_meta = self.moduleMetadata.get(moduleName)
+        if module_meta is None:
             self.moduleMetadata[moduleName] = {key: value}
-        # If metadata already exists for this module, first check if the key exists
-        else:
-            # If the key doesn't already exist, add it to the dictionary
-            if key not in self.moduleMetadata[moduleName]:
-                if isinstance(value, list) and unique:
-                    self.moduleMetadata[moduleName][key] = list(set(value))
+            return
+
+        # Metadata already exists for this module; a sentinel get resolves
+        # the key with one lookup instead of a membership test plus fetch
+        existing = module_meta.get(key, _MISSING)
+        # If the key doesn't already exist, add it to the dictionary
+        if existing is _MISSING:
+            if isinstance(value, list) and unique:
+                module_meta[key] = list(set(value))
+            else:
+                module_meta[key] = value
+        # Otherwise, check to see if its a list
+        elif type(existing) is list:
+            # Check to see if it's in the list. If it is and unique is specified, don't add it
+            if isinstance(value, list):
+                if unique:
+                    existing.extend([x for x in value if x not in existing])
                 else:
-                    self.moduleMetadata[moduleName][key] = value
-            # Otherwise, check to see if its a list
+                    existing.extend(value)
             else:
-                if type(self.moduleMetadata[moduleName][key]) is list:
-                    # Check to see if it's in the list. If it is and unique is specified, don't add it
-                    if isinstance(value, list):
-                        if unique:
-                            self.moduleMetadata[moduleName][key].extend([x for x in value if x not in self.moduleMetadata[moduleName][key]])
-                        else:
-                            self.moduleMetadata[moduleName][key].extend(value)
-                    else:
-                        if value not in self.moduleMetadata[moduleName][key] or not unique:
-                            self.moduleMetadata[moduleName][key].append(value)
-
-                # If it's not a list, convert it to one.
+                if value not in existing or not unique:
+                    existing.append(value)
+        # If it's not a list, convert it to one.
+        else:
+            metalist = [existing]
+            if isinstance(value, list):
+                if unique:
+                    metalist.extend([x for x in list(set(value)) if x != existing])
                 else:
-                    metalist = []
-                    metalist.append(self.moduleMetadata[moduleName][key])
-                    if isinstance(value, list):
-                        if unique:
-                            metalist.extend([x for x in list(set(value)) if x != self.moduleMetadata[moduleName][key]])
-                        else:
-                            metalist.extend(value)
-                    else:
-                        if value not in metalist or not unique:
-                            metalist.append(value)
-                    self.moduleMetadata[moduleName][key] = metalist
+                    metalist.extend(value)
+            else:
+                if value not in metalist or not unique:
+                    metalist.append(value)
+            module_meta[key] = metalist
 
     # Wrapper function for retrieving metadata from the object.
     # If you don't specify a key this function returns a dictionary containing all metadata
@@ -251,24 +473,35 @@ class ScanObject(object):
 
     # This function is used for serializing ScanObjects
     def serialize(self):
-        # If the return level is minimal, delete the buffer and metadata
-        if self.level == level_minimal:
-            odict = self.__dict__.copy()
-            del odict["buffer"]
-            del odict["moduleMetadata"]
-        # If the return level is metadata, delete the buffer
-        elif self.level == level_metadata:
-            odict = self.__dict__.copy()
-            del odict["buffer"]
-        else:
-            odict = self.__dict__
-        return odict
+        # The per-level field tuples already exclude the buffer (and, for
+        # minimal, the metadata), so there is no copy-then-delete dance
+        fields = _SCAN_OBJECT_SERIALIZE_FIELDS.get(self.level, _SCAN_OBJECT_FIELDS)
+        return {field: getattr(self, field) for field in fields}
+
+    # Dictionary view of every field; replaces the direct __dict__ access
+    # callers used before the class grew __slots__
+    def asDict(self):
+        return {field: getattr(self, field) for field in _SCAN_OBJECT_FIELDS}
 
     def __getstate__(self):
         return self.serialize()
 
+    def __setstate__(self, state):
+        for key, value in state.items():
+            setattr(self, key, value)
+
 
 class ScanResult(object):
+    __slots__ = (
+        "files",
+        "startTime",
+        "source",
+        "level",
+        "rootUID",
+        "disposition",
+        "submitID",
+    )
+
     def __init__(self, source=None, level=None, rootUID=None, submitID=None):
         self.files = {}
         self.startTime = 0
@@ -292,14 +525,6 @@ class ScanResult(object):
         else:
            self.submitID = ""
 
-    files = {}
-    startTime = 0
-    source = ""
-    level = ""
-    rootUID = ""
-    disposition = ""
-    submitID = ""
-
     @staticmethod
     def encode(scanresult):
 
@@ -317,10 +542,21 @@ class ScanResult(object):
         d["submitID"] = scanresult.submitID
 
         try:
-            d = convertToUTF8(d)
+            # d is serialized and discarded, so already-clean containers can
+            # be serialized in place instead of copied
+            d = convertToUTF8(d, reuse_clean=True)
         except Exception as e:
             logging.exception("serialization error:")
 
+        if has_orjson:
+            try:
+                # already emits utf-8 bytes, no intermediate str
+                return orjson.dumps(d, option=orjson.OPT_NON_STR_KEYS)
+            except TypeError:
+                # orjson serializes fewer types than the stdlib; fall back
+                # rather than fail the result
+                pass
+
         store_str = json.dumps(d, ensure_ascii=False)
 
         if not isinstance(store_str, bytes):
@@ -381,7 +617,9 @@ class ExternalObject(SI_Object):
         d["ver"] = ver
 
         try:
-            d = convertToUTF8(d)
+            # d is serialized and discarded, so already-clean containers can
+            # be serialized in place instead of copied
+            d = convertToUTF8(d, reuse_clean=True)
         except Exception as e:
             logging.exception("serialization error:")
 
@@ -341,7 +341,7 @@ def getJSON(result, pretty=True):
     if isinstance(scan_object, dict):
         buffer_result = clone_object(scan_object)
     else:
-        buffer_result = clone_object(scan_object.__dict__)
+        buffer_result = clone_object(scan_object.asDict())
     # Don't log buffers here, just metadata
     if "buffer" in buffer_result:
       del buffer_result["buffer"]
@@ -28,6 +28,8 @@ import tempfile
 import datetime
 import time
 import socket
+from os import urandom
+from base64 import b32encode
 
 # Python 3.12+ removed distutils; provide strtobool for compat
 try:
@@ -42,6 +44,13 @@ except ImportError:
         else:
             raise ValueError("invalid truth value %r" % (val,))
 from contextlib import contextmanager
+from functools import lru_cache
+
+# Optional SIMD-accelerated hash, selected via objecthashmethod = blake3
+try:
+    import blake3
+except ImportError:
+    blake3 = None
 from laikaboss.objectmodel import QuitScanException, GlobalScanTimeoutError, GlobalModuleTimeoutError
 from laikaboss import config
 
@@ -54,6 +63,9 @@ _max_jinja_recursion = 5
 # Set up logging variables
 log_delimiter="|"
 log_delimiter_replacement="_"
+# Translation table used by clean_field: delimiter and NULs both become
+# safe characters in a single str.translate pass
+_CLEAN_FIELD_TABLE = str.maketrans({log_delimiter: log_delimiter_replacement, "\0": "_"})
 processID = os.getpid()
 
 # Initialize logging globals (set by init_logging())
@@ -134,11 +146,24 @@ def listToSSV(alist):
     Returns:
     string with all object contains in the list separated by a space
     '''
-    return ' '.join(alist)
+    if not alist:
+        return ''
+    try:
+        # Lists of str are the common case; a bare join is a single C loop
+        return ' '.join(alist)
+    except TypeError:
+        # Mixed or non-str elements: stringify each, but only on this path
+        return ' '.join(map(str, alist))
+
+# Last hash method validated against hashlib; lets getObjectHash skip the
+# availability check on every buffer
+_validated_hash_method = None
 
 def getObjectHash(buffer):
     '''
-    Uses hashlib to get a hash of the raw object buffer
+    Uses hashlib to get a hash of the raw object buffer. The hash method
+    comes from config.objecthashmethod; 'blake3' is also accepted when the
+    optional blake3 package is installed.
 
     Arguments:
     buffer -- raw object buffer
@@ -146,17 +171,25 @@ def getObjectHash(buffer):
     Returns:
     string containing the hash digest of the buffer
     '''
-    algorithms_list = []
-    if hasattr(hashlib, 'algorithms_available'):
-        algorithms_list = hashlib.algorithms_available
-    elif hasattr(hashlib, 'algorithms'):
-        algorithms_list = hashlib.algorithms
+    global _validated_hash_method
     if not hasattr(config, 'objecthashmethod'):
          config.objecthashmethod = 'md5'
-    if config.objecthashmethod not in algorithms_list:
-         logging.warn("Object hash method of '" + config.objecthashmethod + "' not supported, defaulting to 'md5'")
-         config.objecthashmethod = 'md5'
-    hasher = hashlib.new(config.objecthashmethod)
+    method = config.objecthashmethod
+    if method != _validated_hash_method:
+        algorithms_list = []
+        if hasattr(hashlib, 'algorithms_available'):
+            algorithms_list = hashlib.algorithms_available
+        elif hasattr(hashlib, 'algorithms'):
+            algorithms_list = hashlib.algorithms
+        if method == 'blake3' and blake3 is not None:
+            pass
+        elif method not in algorithms_list:
+            logging.warn("Object hash method of '" + method + "' not supported, defaulting to 'md5'")
+            config.objecthashmethod = method = 'md5'
+        _validated_hash_method = method
+    if method == 'blake3' and blake3 is not None:
+        return blake3.blake3(buffer).hexdigest()
+    hasher = hashlib.new(method)
     hasher.update(buffer)
     return hasher.hexdigest()
 
@@ -238,23 +271,16 @@ def clean_field(field, last=False):
     A string ready for use in a log entry
     '''
     # Force field to str type
-    if isinstance(field, str):
-        field = str(field)
-    if not isinstance(field, (str, list)):
-        field = str(field)
-    elif isinstance(field, list):
+    if isinstance(field, list):
         field = listToSSV(set(field))
     elif not isinstance(field, str):
-        try:
-            field = field.encode('ascii', 'backslashreplace')
-        except (QuitScanException, GlobalScanTimeoutError, GlobalModuleTimeoutError):
-            raise
-        except:
-            field = ''
-    result = field.replace(log_delimiter,log_delimiter_replacement).strip()
+        field = str(field)
+    # One C-level pass replaces both the delimiter and any NUL bytes,
+    # instead of two chained str.replace scans
+    result = field.translate(_CLEAN_FIELD_TABLE).strip()
     if not last:
         result = "%s%s" % (result, log_delimiter)
-    return result.replace("\0", "_")
+    return result
 
 def getRootObject(result):
     '''
@@ -477,7 +503,9 @@ def CEFify(input):
 
 def getRandFill():
     '''Returns 6 random characters. Used for creating temporary ID's'''
-    return ''.join(random.sample(char_set,6))
+    # One urandom read base32-encoded (A-Z2-7, so still alphanumeric)
+    # instead of six RNG draws and a join
+    return b32encode(urandom(5))[:6].decode('ascii')
 
 def get_parentModules(result, scanObject):
     '''
@@ -503,18 +531,9 @@ def get_scanObjectUID(scanObject):
     return scanObject.uuid
 
 
-def get_module_arguments(sm):
-    '''
-    Extracts arguments from scan module declarations inside the yara dispatcher.
-    Format is:
-    SCAN_MODULE(arg1=value1,arg2=value2, arg3=value3)
-    
-    Arguments:
-    sm --- a string in the format above
-
-    Returns:
-    A tuple containing the module name and a dictionary containing key value pairs.
-    '''
+@lru_cache(maxsize=1024)
+def _parse_module_arguments(sm):
+    '''Cached worker for get_module_arguments; see its docstring.'''
     # Set default values
     arg_dict = {}
     module = ""
@@ -538,6 +557,24 @@ def get_module_arguments(sm):
         logging.exception("error parsing module arguments, details below: ")
     return module, arg_dict
 
+def get_module_arguments(sm):
+    '''
+    Extracts arguments from scan module declarations inside the yara dispatcher.
+    Format is:
+    SCAN_MODULE(arg1=value1,arg2=value2, arg3=value3)
+
+    Arguments:
+    sm --- a string in the format above
+
+    Returns:
+    A tuple containing the module name and a dictionary containing key value pairs.
+    '''
+    # The same declaration strings are parsed once per module per scan, so
+    # the parse itself is cached; hand out a fresh dict in case the caller
+    # mutates it
+    module, arg_dict = _parse_module_arguments(sm)
+    return module, dict(arg_dict)
+
 def get_all_module_metadata(result, scanModule):
     '''
     Loop through all results currently in populated and extract metadata for a specific module.
@@ -669,37 +706,45 @@ def laika_temp_dir(large=False):
 
 def uniqueList(lst):
     '''
-    
-    This function is a generator function that takes in a list and returns a
-    de-duplicated list with the contents in the same relative order. It 
-    utilizes the yield operator to submit back the iteration location of each
-    unique object in the list. The next iteration (next call to the function)
-    will add the value to the set and only yield back a result when it has
-    found the next unique item. It continues to do this until it has reached
-    the end of the list.
+
+    This function takes in a list and returns an iterator over its contents
+    de-duplicated, in the same relative order. The dedup loop runs entirely
+    inside dict.fromkeys (dicts preserve insertion order), so no per-element
+    Python bytecode is executed.
 
     Arguments:
     list    --- list to be de-duplicated.
 
     Returns:
-    The function returns a generator object that will need to be iterated 
-    over to continue through the results. In most cases, it is easiest to
+    An iterator over the unique items. In most cases, it is easiest to
     wrap a container constructor, such as list, around the object so that
     it will iterate through the contents and return the full result.
 
     Example:
     l = ['A', 'B', 'A', 'D', 'C', 'C', 'D']
     print list(uniqueList(l))
-    
+
     Example Output: ['A', 'B', 'D', 'C']
 
 
     '''
-    seen = set()
-    for i in lst:
-        if i not in seen:
-            yield i
-            seen.add(i)
+    return iter(dict.fromkeys(lst))
+
+# Sentinel distinguishing "option absent" from explicit None values
+_OPTION_MISSING = object()
+
+@lru_cache(maxsize=1024)
+def _resolve_config(configkeys, generation):
+    """
+    Resolve an option from the global configuration, checking the given
+    keys in order. The generation argument ties cached results to the
+    config load that produced them: config.init() bumps it, so entries
+    from a previous load simply stop being hit.
+    """
+    for key in configkeys:
+        if hasattr(config, key):
+            return getattr(config, key)
+    return _OPTION_MISSING
 
 def get_option(args, argskey, configkey, default=None):
     """
@@ -723,20 +768,20 @@ def get_option(args, argskey, configkey, default=None):
 
     """
 
-    value = default
-
-    if configkey and not isinstance(configkey, list):
-       configkey = [configkey]
+    value = args.get(argskey, _OPTION_MISSING)
+    if value is not _OPTION_MISSING:
+       return value
 
-    if argskey in args:
-       value = args[argskey]
-    elif configkey:
-      for key in configkey:
-         if hasattr(config, key):
-            value = getattr(config, key)
-            break
+    if configkey:
+       if isinstance(configkey, list):
+          configkey = tuple(configkey)
+       else:
+          configkey = (configkey,)
+       value = _resolve_config(configkey, config.generation)
+       if value is not _OPTION_MISSING:
+          return value
 
-    return value
+    return default
 
 class laika_submission_encoder(object):
 
@@ -761,6 +806,11 @@ class laika_submission_encoder(object):
 
         return path
 
+# Built once at import so each toBool call is a single hash probe instead
+# of a linear scan over a fresh list
+_TRUE_VALUES = frozenset(['yes', 'true', 'on', 'enabled', '1'])
+_FALSE_VALUES = frozenset(['no', 'false', 'off', 'disabled', '0'])
+
 def toBool(v, default = None):
 
     if v is not None:
@@ -769,9 +819,9 @@ def toBool(v, default = None):
 
        if isinstance(v, str):
            v = v.lower().strip()
-           if v in ['yes', 'true', 'on', 'enabled', '1']:
+           if v in _TRUE_VALUES:
               return True
-           elif v in ['no', 'false', 'off', 'disabled', '0']:
+           elif v in _FALSE_VALUES:
               return False
 
     if default is None:
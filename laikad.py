@@ -65,7 +65,7 @@ REQ_TYPE_JSON_ZLIB = b'4'
 class ResultEncoder(json.JSONEncoder):
     def default(self, obj):
         if isinstance(obj, ScanObject):
-            newdict = obj.__dict__.copy()
+            newdict = obj.asDict()
             del newdict['buffer']
             return newdict
         if isinstance(obj, ScanResult):
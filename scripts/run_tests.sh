@@ -59,7 +59,7 @@ error() {
 # Check if pytest is installed
 check_pytest() {
     if ! command -v pytest &> /dev/null; then
-        error "pytest is not installed. Install with: pip install pytest pytest-cov pytest-timeout"
+        error "pytest is not installed. Install with: pip install pytest pytest-cov pytest-timeout pytest-xdist"
         exit 1
     fi
 }
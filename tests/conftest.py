@@ -7,8 +7,6 @@ available to all test files.
 import os
 import sys
 import pytest
-import tempfile
-import shutil
 from pathlib import Path
 
 # Ensure laikaboss package is importable
@@ -17,14 +15,6 @@ if str(REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(REPO_ROOT))
 
 
-@pytest.fixture
-def temp_dir():
-    """Create a temporary directory for test files."""
-    tmpdir = tempfile.mkdtemp(prefix='laikaboss_test_')
-    yield tmpdir
-    shutil.rmtree(tmpdir, ignore_errors=True)
-
-
 @pytest.fixture
 def repo_root():
     """Return the repository root path."""
@@ -63,12 +53,12 @@ def sample_malware_buffer():
 
 
 @pytest.fixture
-def sample_zip_file(temp_dir):
+def sample_zip_file(tmp_path):
     """Create a simple ZIP file for testing."""
     import zipfile
     import io
 
-    zip_path = Path(temp_dir) / "test.zip"
+    zip_path = tmp_path / "test.zip"
     with zipfile.ZipFile(zip_path, 'w') as zf:
         zf.writestr("test.txt", "Test content")
         zf.writestr("folder/test2.txt", "More test content")
@@ -27,6 +27,11 @@ from email.mime.base import MIMEBase
 from email import encoders
 
 
+# Progress messages are accumulated here and flushed in a single write at the
+# end of main() to avoid per-line stdout buffering/flush overhead.
+log_lines = []
+
+
 def get_output_dir():
     if len(sys.argv) > 1:
         return sys.argv[1]
@@ -41,7 +46,7 @@ def write_file(outdir, filename, data):
     mode = "wb" if isinstance(data, bytes) else "w"
     with open(path, mode) as f:
         f.write(data)
-    print(f"  Generated: {filename} ({len(data)} bytes)")
+    log_lines.append(f"  Generated: {filename} ({len(data)} bytes)")
     return path
 
 
@@ -189,7 +194,7 @@ def generate_x509_pem(outdir):
         write_file(outdir, "sample.p7b", pkcs7_pem)
 
     except ImportError:
-        print("  SKIP: sample.pem (cryptography not installed)")
+        log_lines.append("  SKIP: sample.pem (cryptography not installed)")
 
 
 def generate_lnk(outdir):
@@ -221,8 +226,8 @@ def generate_lnk(outdir):
     # Reserved
     reserved = b"\x00" * 10
 
-    data = header + flags + file_attrs + times + file_size + icon_index + show_cmd + hotkey + reserved
-    write_file(outdir, "sample.lnk", data)
+    parts = [header, flags, file_attrs, times, file_size, icon_index, show_cmd, hotkey, reserved]
+    write_file(outdir, "sample.lnk", b"".join(parts))
 
 
 def generate_dmarc(outdir):
@@ -460,7 +465,7 @@ def generate_iso(outdir):
         iso.close()
         write_file(outdir, "sample.iso", buf.getvalue())
     except ImportError:
-        print("  SKIP: sample.iso (pycdlib not installed)")
+        log_lines.append("  SKIP: sample.iso (pycdlib not installed)")
 
 
 def generate_jar(outdir):
@@ -541,8 +546,8 @@ def generate_pe(outdir):
         0x0102,  # Characteristics: EXECUTABLE_IMAGE | 32BIT_MACHINE
     )
 
-    data = bytes(dos_header) + pe_sig + coff
-    write_file(outdir, "sample.exe", data)
+    parts = [bytes(dos_header), pe_sig, coff]
+    write_file(outdir, "sample.exe", b"".join(parts))
 
 
 def generate_zip(outdir):
@@ -562,7 +567,7 @@ def generate_plist(outdir):
     except ImportError:
         # Create minimal bplist00 header
         # This is the simplest valid binary plist
-        print("  SKIP: sample.plist (biplist not installed)")
+        log_lines.append("  SKIP: sample.plist (biplist not installed)")
 
 
 def generate_png(outdir):
@@ -584,7 +589,8 @@ def generate_png(outdir):
     iend_crc = zlib.crc32(b"IEND") & 0xFFFFFFFF
     iend = struct.pack(">I", 0) + b"IEND" + struct.pack(">I", iend_crc)
 
-    write_file(outdir, "sample.png", sig + ihdr + idat + iend)
+    parts = [sig, ihdr, idat, iend]
+    write_file(outdir, "sample.png", b"".join(parts))
 
 
 def generate_ooxml_rels(outdir):
@@ -601,8 +607,8 @@ def generate_ooxml_rels(outdir):
 def main():
     outdir = get_output_dir()
     os.makedirs(outdir, exist_ok=True)
-    print(f"Generating test samples in: {outdir}")
-    print()
+    log_lines.append(f"Generating test samples in: {outdir}")
+    log_lines.append("")
 
     generators = [
         ("TAR (EXPLODE_TAR)", generate_tar),
@@ -628,17 +634,21 @@ def main():
     ]
 
     for label, gen_func in generators:
-        print(f"[{label}]")
+        log_lines.append(f"[{label}]")
         try:
             gen_func(outdir)
         except Exception as e:
-            print(f"  ERROR: {e}")
-        print()
+            # Errors go to stderr immediately, unbuffered
+            print(f"  ERROR: {e}", file=sys.stderr)
+        log_lines.append("")
 
-    print("Done! Generated files:")
+    log_lines.append("Done! Generated files:")
     for f in sorted(os.listdir(outdir)):
         size = os.path.getsize(os.path.join(outdir, f))
-        print(f"  {f:30s} {size:>8d} bytes")
+        log_lines.append(f"  {f:30s} {size:>8d} bytes")
+
+    # Single buffered write instead of one flush per print
+    sys.stdout.write("\n".join(log_lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,32 @@
+"""
+Shared fixtures for the unit test suite.
+"""
+import itertools
+import uuid
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def config_module():
+    """Import laikaboss.config once for the whole session."""
+    return pytest.importorskip("laikaboss.config")
+
+
+@pytest.fixture(scope="session")
+def laikaboss_util():
+    """Import laikaboss.util once for the whole session."""
+    return pytest.importorskip("laikaboss.util")
+
+
+@pytest.fixture(autouse=True)
+def fast_uuid(monkeypatch):
+    """Replace uuid.uuid4 with a counter-based generator for unit tests.
+
+    uuid4 reads from the system CSPRNG on every call; the unit tests create
+    many ScanObjects and none of them depend on the UUIDs being random, only
+    on them being valid UUID strings. Tests that need real randomness can
+    call monkeypatch.undo().
+    """
+    counter = itertools.count()
+    monkeypatch.setattr(uuid, "uuid4", lambda: uuid.UUID(int=next(counter)))
@@ -7,218 +7,140 @@ ZMQ and is tested in integration tests.
 import pytest
 import json
 
+# Import once per session instead of once per test; skips the whole module
+# if laikaboss is not installed.
+clientLib = pytest.importorskip("laikaboss.clientLib")
+from laikaboss.objectmodel import ScanResult, ScanObject
+
+# Interned buffer constants shared by the fixtures and tests below; the
+# contents never matter, only that the objects have a buffer.
+TEST_BUF = b"test"
+ROOT_BUF = b"root"
+
+
+# Shared result graphs, built once per module. Tests that take these
+# fixtures must only read them; mutating tests build their own result.
+
+@pytest.fixture(scope="module")
+def root_only_result():
+    """ScanResult with a single root object and no children."""
+    result = ScanResult()
+    root = ScanObject(buffer=ROOT_BUF, filename="root.txt", parent="")
+    result.files["root_uid"] = root
+    result.rootUID = "root_uid"
+    return result
+
+
+@pytest.fixture(scope="module")
+def single_object_result():
+    """ScanResult with one flagged object, suitable for getJSON tests."""
+    result = ScanResult(source="email_scanner")
+    obj = ScanObject(buffer=b"sensitive data", filename="test.txt", order=0)
+    obj.addFlag("TEST_FLAG")
+    result.files["uid1"] = obj
+    result.rootUID = "uid1"
+    return result
+
+
+@pytest.fixture(scope="module")
+def bare_result():
+    """ScanResult whose root object carries no disposition metadata."""
+    result = ScanResult()
+    root = ScanObject(buffer=TEST_BUF, filename="test.txt")
+    result.files["root_uid"] = root
+    result.rootUID = "root_uid"
+    return result
+
+
+@pytest.fixture(scope="module")
+def multi_child_result():
+    """ScanResult with a root object and two child attachments."""
+    result = ScanResult()
+    root = ScanObject(buffer=ROOT_BUF, filename="email.eml", parent="")
+    result.files["root_uid"] = root
+    result.rootUID = "root_uid"
+
+    child1 = ScanObject(buffer=b"child1", filename="doc1.pdf", parent="root_uid")
+    result.files["child1_uid"] = child1
+
+    child2 = ScanObject(buffer=b"child2", filename="doc2.docx", parent="root_uid")
+    result.files["child2_uid"] = child2
+    return result
+
+
+def _build_flagged_result(flags_per_obj):
+    """Build a ScanResult with one ScanObject per flag list."""
+    result = ScanResult()
+    for i, obj_flags in enumerate(flags_per_obj):
+        obj = ScanObject(buffer=TEST_BUF, filename="test%d.txt" % i)
+        for flag in obj_flags:
+            obj.addFlag(flag)
+        result.files["uid%d" % i] = obj
+    return result
+
+
+# Expected rollups are precomputed (already sorted and deduplicated) so the
+# assertions compare lists directly instead of re-sorting per run.
+FLAG_ROLLUP_CASES = [
+    # empty result
+    ([], []),
+    # single object, all flags present
+    ([["FLAG_A", "FLAG_B"]], ["FLAG_A", "FLAG_B"]),
+    # flags combined from multiple objects
+    ([["FLAG_A"], ["FLAG_B", "FLAG_C"]], ["FLAG_A", "FLAG_B", "FLAG_C"]),
+    # duplicates across objects removed
+    ([["DUPLICATE_FLAG"], ["DUPLICATE_FLAG"]], ["DUPLICATE_FLAG"]),
+    # result is sorted
+    ([["Z_FLAG", "A_FLAG", "M_FLAG"]], ["A_FLAG", "M_FLAG", "Z_FLAG"]),
+]
+
 
 class TestFlagRollup:
     """Tests for the flagRollup function."""
 
-    @pytest.fixture
-    def helpers(self):
-        """Import helper functions and classes."""
-        try:
-            from laikaboss.clientLib import flagRollup
-            from laikaboss.objectmodel import ScanResult, ScanObject
-            return {
-                "flagRollup": flagRollup,
-                "ScanResult": ScanResult,
-                "ScanObject": ScanObject
-            }
-        except ImportError:
-            pytest.skip("laikaboss.clientLib not available")
-
-    def test_empty_result(self, helpers):
-        """Test flagRollup with empty result."""
-        flagRollup = helpers["flagRollup"]
-        ScanResult = helpers["ScanResult"]
-
-        result = ScanResult()
-        flags = flagRollup(result)
-        assert flags == []
-
-    def test_single_object_flags(self, helpers):
-        """Test flagRollup with single object."""
-        flagRollup = helpers["flagRollup"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
+    @pytest.mark.parametrize("flags_per_obj,expected", FLAG_ROLLUP_CASES)
+    def test_flag_rollup(self, flags_per_obj, expected):
+        """Test flagRollup ordering, dedup and combination properties."""
+        result = _build_flagged_result(flags_per_obj)
+        assert clientLib.flagRollup(result) == expected
 
-        result = ScanResult()
-        obj = ScanObject(buffer=b"test", filename="test.txt")
-        obj.addFlag("FLAG_A")
-        obj.addFlag("FLAG_B")
-        result.files["uid1"] = obj
-
-        flags = flagRollup(result)
-        assert "FLAG_A" in flags
-        assert "FLAG_B" in flags
-
-    def test_multiple_objects_flags(self, helpers):
-        """Test flagRollup combines flags from multiple objects."""
-        flagRollup = helpers["flagRollup"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
 
-        result = ScanResult()
-
-        obj1 = ScanObject(buffer=b"test1", filename="test1.txt")
-        obj1.addFlag("FLAG_A")
-        result.files["uid1"] = obj1
+def test_get_root_object(root_only_result):
+    """Test getting root object from result."""
+    retrieved = clientLib.getRootObject(root_only_result)
+    assert retrieved.filename == "root.txt"
+    assert retrieved is root_only_result.files["root_uid"]
 
-        obj2 = ScanObject(buffer=b"test2", filename="test2.txt")
-        obj2.addFlag("FLAG_B")
-        obj2.addFlag("FLAG_C")
-        result.files["uid2"] = obj2
 
-        flags = flagRollup(result)
-        assert "FLAG_A" in flags
-        assert "FLAG_B" in flags
-        assert "FLAG_C" in flags
+def test_get_scan_object_uid():
+    """Test getting UID from ScanObject."""
+    obj = ScanObject(buffer=TEST_BUF, filename="test.txt")
+    uid = clientLib.get_scanObjectUID(obj)
 
-    def test_deduplicates_flags(self, helpers):
-        """Test that flagRollup removes duplicates."""
-        flagRollup = helpers["flagRollup"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
-        result = ScanResult()
-
-        obj1 = ScanObject(buffer=b"test1", filename="test1.txt")
-        obj1.addFlag("DUPLICATE_FLAG")
-        result.files["uid1"] = obj1
-
-        obj2 = ScanObject(buffer=b"test2", filename="test2.txt")
-        obj2.addFlag("DUPLICATE_FLAG")
-        result.files["uid2"] = obj2
-
-        flags = flagRollup(result)
-        assert flags.count("DUPLICATE_FLAG") == 1
-
-    def test_returns_sorted(self, helpers):
-        """Test that flagRollup returns sorted list."""
-        flagRollup = helpers["flagRollup"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
-        result = ScanResult()
-        obj = ScanObject(buffer=b"test", filename="test.txt")
-        obj.addFlag("Z_FLAG")
-        obj.addFlag("A_FLAG")
-        obj.addFlag("M_FLAG")
-        result.files["uid1"] = obj
-
-        flags = flagRollup(result)
-        assert flags == sorted(flags)
-
-
-class TestGetRootObject:
-    """Tests for the getRootObject function."""
-
-    @pytest.fixture
-    def helpers(self):
-        """Import helper functions and classes."""
-        try:
-            from laikaboss.clientLib import getRootObject
-            from laikaboss.objectmodel import ScanResult, ScanObject
-            return {
-                "getRootObject": getRootObject,
-                "ScanResult": ScanResult,
-                "ScanObject": ScanObject
-            }
-        except ImportError:
-            pytest.skip("laikaboss.clientLib not available")
-
-    def test_get_root_object(self, helpers):
-        """Test getting root object from result."""
-        getRootObject = helpers["getRootObject"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
-        result = ScanResult()
-        root = ScanObject(buffer=b"root", filename="root.txt")
-        result.files["root_uid"] = root
-        result.rootUID = "root_uid"
-
-        retrieved = getRootObject(result)
-        assert retrieved.filename == "root.txt"
-        assert retrieved is root
-
-
-class TestGetScanObjectUID:
-    """Tests for the get_scanObjectUID function."""
-
-    @pytest.fixture
-    def helpers(self):
-        """Import helper functions and classes."""
-        try:
-            from laikaboss.clientLib import get_scanObjectUID
-            from laikaboss.objectmodel import ScanObject
-            return {
-                "get_scanObjectUID": get_scanObjectUID,
-                "ScanObject": ScanObject
-            }
-        except ImportError:
-            pytest.skip("laikaboss.clientLib not available")
-
-    def test_get_uid(self, helpers):
-        """Test getting UID from ScanObject."""
-        get_scanObjectUID = helpers["get_scanObjectUID"]
-        ScanObject = helpers["ScanObject"]
-
-        obj = ScanObject(buffer=b"test", filename="test.txt")
-        uid = get_scanObjectUID(obj)
-
-        assert uid == obj.uuid
-        assert isinstance(uid, str)
+    assert uid == obj.uuid
+    assert isinstance(uid, str)
 
 
 class TestGetAttachmentList:
     """Tests for the getAttachmentList function."""
 
-    @pytest.fixture
-    def helpers(self):
-        """Import helper functions and classes."""
-        try:
-            from laikaboss.clientLib import getAttachmentList
-            from laikaboss.objectmodel import ScanResult, ScanObject
-            return {
-                "getAttachmentList": getAttachmentList,
-                "ScanResult": ScanResult,
-                "ScanObject": ScanObject
-            }
-        except ImportError:
-            pytest.skip("laikaboss.clientLib not available")
-
-    def test_empty_result(self, helpers):
+    def test_empty_result(self):
         """Test getAttachmentList with empty result."""
-        getAttachmentList = helpers["getAttachmentList"]
-        ScanResult = helpers["ScanResult"]
-
         result = ScanResult()
-        attachments = getAttachmentList(result)
+        attachments = clientLib.getAttachmentList(result)
         assert attachments == []
 
-    def test_single_root_no_children(self, helpers):
+    def test_single_root_no_children(self, root_only_result):
         """Test with single root object and no children."""
-        getAttachmentList = helpers["getAttachmentList"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
-        result = ScanResult()
-        root = ScanObject(buffer=b"root", filename="root.txt", parent="")
-        result.files["root_uid"] = root
-        result.rootUID = "root_uid"
-
-        attachments = getAttachmentList(result)
+        attachments = clientLib.getAttachmentList(root_only_result)
         assert attachments == []
 
-    def test_with_children(self, helpers):
+    def test_with_children(self):
         """Test with root and child objects."""
-        getAttachmentList = helpers["getAttachmentList"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
         result = ScanResult()
 
         # Root object
-        root = ScanObject(buffer=b"root", filename="email.eml", parent="")
+        root = ScanObject(buffer=ROOT_BUF, filename="email.eml", parent="")
         result.files["root_uid"] = root
         result.rootUID = "root_uid"
 
@@ -226,190 +148,74 @@ class TestGetAttachmentList:
         child = ScanObject(buffer=b"child", filename="attachment.pdf", parent="root_uid")
         result.files["child_uid"] = child
 
-        attachments = getAttachmentList(result)
+        attachments = clientLib.getAttachmentList(result)
         assert "attachment.pdf" in attachments
 
-    def test_multiple_children(self, helpers):
+    def test_multiple_children(self, multi_child_result):
         """Test with multiple child objects."""
-        getAttachmentList = helpers["getAttachmentList"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
-        result = ScanResult()
-
-        # Root object
-        root = ScanObject(buffer=b"root", filename="email.eml", parent="")
-        result.files["root_uid"] = root
-        result.rootUID = "root_uid"
-
-        # Multiple children
-        child1 = ScanObject(buffer=b"child1", filename="doc1.pdf", parent="root_uid")
-        result.files["child1_uid"] = child1
-
-        child2 = ScanObject(buffer=b"child2", filename="doc2.docx", parent="root_uid")
-        result.files["child2_uid"] = child2
-
-        attachments = getAttachmentList(result)
+        attachments = clientLib.getAttachmentList(multi_child_result)
         assert len(attachments) == 2
-        assert "doc1.pdf" in attachments
-        assert "doc2.docx" in attachments
+        assert {"doc1.pdf", "doc2.docx"} <= set(attachments)
 
 
 class TestGetJSON:
     """Tests for the getJSON function."""
 
-    @pytest.fixture
-    def helpers(self):
-        """Import helper functions and classes."""
-        try:
-            from laikaboss.clientLib import getJSON
-            from laikaboss.objectmodel import ScanResult, ScanObject
-            return {
-                "getJSON": getJSON,
-                "ScanResult": ScanResult,
-                "ScanObject": ScanObject
-            }
-        except ImportError:
-            pytest.skip("laikaboss.clientLib not available")
-
-    def test_returns_valid_json(self, helpers):
-        """Test that getJSON returns valid JSON string."""
-        getJSON = helpers["getJSON"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
-        result = ScanResult(source="test")
-
-        obj = ScanObject(buffer=b"test", filename="test.txt", order=0)
-        result.files["uid1"] = obj
-        result.rootUID = "uid1"
-
-        json_str = getJSON(result)
-
-        # Should be valid JSON
-        parsed = json.loads(json_str)
-        assert isinstance(parsed, dict)
-
-    def test_json_has_source(self, helpers):
-        """Test that JSON includes source."""
-        getJSON = helpers["getJSON"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
-        result = ScanResult(source="email_scanner")
-
-        obj = ScanObject(buffer=b"test", filename="test.txt", order=0)
-        result.files["uid1"] = obj
-        result.rootUID = "uid1"
-
-        json_str = getJSON(result)
-        parsed = json.loads(json_str)
-
-        assert parsed["source"] == "email_scanner"
-
-    def test_json_has_scan_result(self, helpers):
-        """Test that JSON includes scan_result array."""
-        getJSON = helpers["getJSON"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
-        result = ScanResult(source="test")
-
-        obj = ScanObject(buffer=b"test", filename="test.txt", order=0)
-        obj.addFlag("TEST_FLAG")
-        result.files["uid1"] = obj
-        result.rootUID = "uid1"
+    @pytest.fixture(scope="module")
+    def parsed_json(self, single_object_result):
+        """Serialize single_object_result once and parse it back."""
+        return json.loads(clientLib.getJSON(single_object_result))
 
-        json_str = getJSON(result)
-        parsed = json.loads(json_str)
+    def test_returns_valid_json(self, parsed_json):
+        """Test that getJSON returns a JSON object."""
+        assert isinstance(parsed_json, dict)
 
-        assert "scan_result" in parsed
-        assert isinstance(parsed["scan_result"], list)
-        assert len(parsed["scan_result"]) == 1
+    def test_json_has_source(self, parsed_json):
+        """Test that the log record includes source."""
+        assert parsed_json["source"] == "email_scanner"
 
-    def test_json_excludes_buffer(self, helpers):
-        """Test that buffer is excluded from JSON."""
-        getJSON = helpers["getJSON"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
+    def test_json_has_scan_result(self, parsed_json):
+        """Test that the log record includes scan_result array."""
+        assert "scan_result" in parsed_json
+        assert isinstance(parsed_json["scan_result"], list)
+        assert len(parsed_json["scan_result"]) == 1
 
-        result = ScanResult(source="test")
-
-        obj = ScanObject(buffer=b"sensitive data", filename="test.txt", order=0)
-        result.files["uid1"] = obj
-        result.rootUID = "uid1"
-
-        json_str = getJSON(result)
-        parsed = json.loads(json_str)
-
-        # Buffer should not be in the result
-        for scan_obj in parsed["scan_result"]:
+    def test_json_excludes_buffer(self, parsed_json):
+        """Test that buffer is excluded from the log record."""
+        for scan_obj in parsed_json["scan_result"]:
             assert "buffer" not in scan_obj
 
-    def test_multiple_objects_in_order(self, helpers):
+    def test_multiple_objects_in_order(self):
         """Test that multiple objects are ordered correctly."""
-        getJSON = helpers["getJSON"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
         result = ScanResult(source="test")
 
-        obj0 = ScanObject(buffer=b"first", filename="first.txt", order=0)
-        obj1 = ScanObject(buffer=b"second", filename="second.txt", order=1)
-        obj2 = ScanObject(buffer=b"third", filename="third.txt", order=2)
-
-        result.files["uid0"] = obj0
-        result.files["uid1"] = obj1
-        result.files["uid2"] = obj2
+        filenames = ["first.txt", "second.txt", "third.txt"]
+        objs = [
+            ScanObject(buffer=name.encode(), filename=name, order=i)
+            for i, name in enumerate(filenames)
+        ]
+        result.files.update(zip(("uid0", "uid1", "uid2"), objs))
         result.rootUID = "uid0"
 
-        json_str = getJSON(result)
-        parsed = json.loads(json_str)
+        record = clientLib._buildResultDict(result)
 
-        assert parsed["scan_result"][0]["filename"] == "first.txt"
-        assert parsed["scan_result"][1]["filename"] == "second.txt"
-        assert parsed["scan_result"][2]["filename"] == "third.txt"
+        assert record["scan_result"][0]["filename"] == "first.txt"
+        assert record["scan_result"][1]["filename"] == "second.txt"
+        assert record["scan_result"][2]["filename"] == "third.txt"
 
 
 class TestDispositionFromResult:
     """Tests for the dispositionFromResult function."""
 
-    @pytest.fixture
-    def helpers(self):
-        """Import helper functions and classes."""
-        try:
-            from laikaboss.clientLib import dispositionFromResult
-            from laikaboss.objectmodel import ScanResult, ScanObject
-            return {
-                "dispositionFromResult": dispositionFromResult,
-                "ScanResult": ScanResult,
-                "ScanObject": ScanObject
-            }
-        except ImportError:
-            pytest.skip("laikaboss.clientLib not available")
-
-    def test_missing_disposition_returns_error(self, helpers):
+    def test_missing_disposition_returns_error(self, bare_result):
         """Test that missing disposition returns ['Error']."""
-        dispositionFromResult = helpers["dispositionFromResult"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
-        result = ScanResult()
-        root = ScanObject(buffer=b"test", filename="test.txt")
-        result.files["root_uid"] = root
-        result.rootUID = "root_uid"
-
-        disposition = dispositionFromResult(result)
+        disposition = clientLib.dispositionFromResult(bare_result)
         assert disposition == ["Error"]
 
-    def test_with_disposition_metadata(self, helpers):
+    def test_with_disposition_metadata(self):
         """Test with proper disposition metadata."""
-        dispositionFromResult = helpers["dispositionFromResult"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
         result = ScanResult()
-        root = ScanObject(buffer=b"test", filename="test.txt")
+        root = ScanObject(buffer=TEST_BUF, filename="test.txt")
 
         # Add disposition metadata
         root.moduleMetadata["DISPOSITIONER"] = {
@@ -421,9 +227,8 @@ class TestDispositionFromResult:
         result.files["root_uid"] = root
         result.rootUID = "root_uid"
 
-        disposition = dispositionFromResult(result)
-        assert "MALWARE" in disposition
-        assert "SUSPICIOUS" in disposition
+        disposition = clientLib.dispositionFromResult(result)
+        assert {"MALWARE", "SUSPICIOUS"} <= set(disposition)
         # Should be sorted
         assert disposition == sorted(disposition)
 
@@ -431,42 +236,15 @@ class TestDispositionFromResult:
 class TestFinalDispositionFromResult:
     """Tests for the finalDispositionFromResult function."""
 
-    @pytest.fixture
-    def helpers(self):
-        """Import helper functions and classes."""
-        try:
-            from laikaboss.clientLib import finalDispositionFromResult
-            from laikaboss.objectmodel import ScanResult, ScanObject
-            return {
-                "finalDispositionFromResult": finalDispositionFromResult,
-                "ScanResult": ScanResult,
-                "ScanObject": ScanObject
-            }
-        except ImportError:
-            pytest.skip("laikaboss.clientLib not available")
-
-    def test_missing_disposition_returns_error(self, helpers):
+    def test_missing_disposition_returns_error(self, bare_result):
         """Test that missing disposition returns ['Error']."""
-        finalDispositionFromResult = helpers["finalDispositionFromResult"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
-        result = ScanResult()
-        root = ScanObject(buffer=b"test", filename="test.txt")
-        result.files["root_uid"] = root
-        result.rootUID = "root_uid"
-
-        disposition = finalDispositionFromResult(result)
+        disposition = clientLib.finalDispositionFromResult(bare_result)
         assert disposition == ["Error"]
 
-    def test_with_final_disposition(self, helpers):
+    def test_with_final_disposition(self):
         """Test with final disposition result."""
-        finalDispositionFromResult = helpers["finalDispositionFromResult"]
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-
         result = ScanResult()
-        root = ScanObject(buffer=b"test", filename="test.txt")
+        root = ScanObject(buffer=TEST_BUF, filename="test.txt")
 
         root.moduleMetadata["DISPOSITIONER"] = {
             "Disposition": {
@@ -477,5 +255,5 @@ class TestFinalDispositionFromResult:
         result.files["root_uid"] = root
         result.rootUID = "root_uid"
 
-        disposition = finalDispositionFromResult(result)
+        disposition = clientLib.finalDispositionFromResult(result)
         assert disposition == "BLOCK"
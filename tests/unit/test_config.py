@@ -5,21 +5,11 @@ Tests configuration loading and parsing.
 """
 import pytest
 import os
-import tempfile
 
 
 class TestConfigDefaults:
     """Tests for configuration defaults."""
 
-    @pytest.fixture
-    def config_module(self):
-        """Import the config module."""
-        try:
-            from laikaboss import config
-            return config
-        except ImportError:
-            pytest.skip("laikaboss.config not available")
-
     def test_defaults_exist(self, config_module):
         """Test that defaults dictionary exists."""
         assert hasattr(config_module, 'defaults')
@@ -61,54 +51,30 @@ class TestConfigDefaults:
 class TestConfigInit:
     """Tests for config.init() function."""
 
-    @pytest.fixture
-    def config_module(self):
-        """Import the config module."""
-        try:
-            from laikaboss import config
-            return config
-        except ImportError:
-            pytest.skip("laikaboss.config not available")
-
-    def test_init_with_devnull(self, config_module):
-        """Test init with /dev/null (no config file)."""
+    # ConfigParser silently ignores missing or empty files, so init must
+    # succeed for both cases.
+    @pytest.mark.parametrize("path", [
+        os.devnull,
+        "/nonexistent/path/to/config.conf",
+    ])
+    def test_init_without_config_file(self, config_module, path):
+        """Test init with an empty or non-existent config file."""
         # Should not raise
-        config_module.init(path=os.devnull)
+        config_module.init(path=path)
 
-    def test_init_with_valid_config(self, config_module):
+    def test_init_with_valid_config(self, config_module, tmp_path_factory):
         """Test init with a valid config file."""
-        # Create a temporary config file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
-            f.write("[General]\n")
-            f.write("maxdepth = 20\n")
-            f.write("tempdir = /tmp/test\n")
-            config_path = f.name
-
-        try:
-            config_module.init(path=config_path)
-            # The config should have been loaded
-            assert hasattr(config_module, 'maxdepth')
-        finally:
-            os.unlink(config_path)
-
-    def test_init_with_nonexistent_file(self, config_module):
-        """Test init with non-existent file (should not crash)."""
-        # ConfigParser handles this gracefully
-        config_module.init(path="/nonexistent/path/to/config.conf")
+        config_path = tmp_path_factory.mktemp("cfg") / "valid.conf"
+        config_path.write_text("[General]\nmaxdepth = 20\ntempdir = /tmp/test\n")
+
+        config_module.init(path=str(config_path))
+        # The config should have been loaded
+        assert hasattr(config_module, 'maxdepth')
 
 
 class TestConfigSectionMap:
     """Tests for _ConfigSectionMap function."""
 
-    @pytest.fixture
-    def config_module(self):
-        """Import the config module."""
-        try:
-            from laikaboss import config
-            return config
-        except ImportError:
-            pytest.skip("laikaboss.config not available")
-
     def test_nonexistent_section_returns_empty_dict(self, config_module):
         """Test that non-existent section returns empty dict."""
         config_module.init(path=os.devnull)
@@ -119,15 +85,6 @@ class TestConfigSectionMap:
 class TestMapToGlobals:
     """Tests for _map_to_globals function."""
 
-    @pytest.fixture
-    def config_module(self):
-        """Import the config module."""
-        try:
-            from laikaboss import config
-            return config
-        except ImportError:
-            pytest.skip("laikaboss.config not available")
-
     def test_true_string_becomes_bool(self, config_module):
         """Test that 'true' string becomes True boolean."""
         config_module._map_to_globals({'testbool': 'true'})
@@ -151,69 +108,56 @@ class TestMapToGlobals:
 class TestConfigParsing:
     """Test config file parsing with actual config content."""
 
-    @pytest.fixture
-    def config_module(self):
-        """Import the config module."""
-        try:
-            from laikaboss import config
-            return config
-        except ImportError:
-            pytest.skip("laikaboss.config not available")
-
-    def test_parse_general_section(self, config_module):
+    # Config contents are static, so each file is written once per module
+    # via tmp_path_factory instead of a NamedTemporaryFile per test.
+
+    @pytest.fixture(scope="module")
+    def general_config_path(self, tmp_path_factory):
+        """Config file with a General section."""
+        path = tmp_path_factory.mktemp("cfg") / "general.conf"
+        path.write_text("[General]\nmaxdepth = 15\ntempdir = /custom/temp\n")
+        return str(path)
+
+    @pytest.fixture(scope="module")
+    def logging_config_path(self, tmp_path_factory):
+        """Config file with a Logging section."""
+        path = tmp_path_factory.mktemp("cfg") / "logging.conf"
+        path.write_text(
+            "[Logging]\n"
+            "logfacility = LOG_LOCAL5\n"
+            "logidentity = test_laika\n"
+            "modulelogging = true\n"
+        )
+        return str(path)
+
+    @pytest.fixture(scope="module")
+    def proxies_config_path(self, tmp_path_factory):
+        """Config file with a Proxies section."""
+        path = tmp_path_factory.mktemp("cfg") / "proxies.conf"
+        path.write_text(
+            "[Proxies]\n"
+            "http = http://proxy.example.com:8080\n"
+            "https = https://proxy.example.com:8080\n"
+        )
+        return str(path)
+
+    def test_parse_general_section(self, config_module, general_config_path):
         """Test parsing General section."""
-        config_content = """
-[General]
-maxdepth = 15
-tempdir = /custom/temp
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
-            f.write(config_content)
-            config_path = f.name
-
-        try:
-            config_module.init(path=config_path)
-            # Values should be loaded
-            assert config_module.maxdepth == '15'
-            assert config_module.tempdir == '/custom/temp'
-        finally:
-            os.unlink(config_path)
-
-    def test_parse_logging_section(self, config_module):
+        config_module.init(path=general_config_path)
+        # Values should be loaded
+        assert config_module.maxdepth == '15'
+        assert config_module.tempdir == '/custom/temp'
+
+    def test_parse_logging_section(self, config_module, logging_config_path):
         """Test parsing Logging section."""
-        config_content = """
-[Logging]
-logfacility = LOG_LOCAL5
-logidentity = test_laika
-modulelogging = true
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
-            f.write(config_content)
-            config_path = f.name
-
-        try:
-            config_module.init(path=config_path)
-            assert config_module.logfacility == 'LOG_LOCAL5'
-            assert config_module.logidentity == 'test_laika'
-            assert config_module.modulelogging is True
-        finally:
-            os.unlink(config_path)
-
-    def test_parse_proxies_section(self, config_module):
+        config_module.init(path=logging_config_path)
+        assert config_module.logfacility == 'LOG_LOCAL5'
+        assert config_module.logidentity == 'test_laika'
+        assert config_module.modulelogging is True
+
+    def test_parse_proxies_section(self, config_module, proxies_config_path):
         """Test parsing Proxies section."""
-        config_content = """
-[Proxies]
-http = http://proxy.example.com:8080
-https = https://proxy.example.com:8080
-"""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.conf', delete=False) as f:
-            f.write(config_content)
-            config_path = f.name
-
-        try:
-            config_module.init(path=config_path)
-            # Proxies should be loaded
-            if hasattr(config_module, 'proxies'):
-                assert 'http' in config_module.proxies or 'https' in config_module.proxies
-        finally:
-            os.unlink(config_path)
+        config_module.init(path=proxies_config_path)
+        # Proxies should be loaded
+        if hasattr(config_module, 'proxies'):
+            assert 'http' in config_module.proxies or 'https' in config_module.proxies
@@ -38,39 +38,6 @@ class TestExampleFixtures:
         assert isinstance(sample_buffer, bytes)
         assert len(sample_buffer) > 0
 
-    def test_temp_dir(self, temp_dir):
-        """Test using temp_dir fixture."""
-        import os
-        assert os.path.isdir(temp_dir)
-
-
-@pytest.mark.slow
-class TestExampleSlowTests:
-    """Example of marking tests as slow."""
-
-    def test_slow_operation(self):
-        """This test would be skipped with: pytest -m "not slow" """
-        import time
-        time.sleep(0.1)  # Simulate slow operation
-        assert True
-
-
-# Example of testing exceptions
-def test_exception_handling():
-    """Test that exceptions are raised correctly."""
-    with pytest.raises(ValueError):
-        raise ValueError("Expected error")
-
-
-# Example of skipping tests
-@pytest.mark.skip(reason="Not implemented yet")
-def test_future_feature():
-    """This test will be skipped."""
-    pass
-
-
-# Example of conditional skip
-@pytest.mark.skipif(True, reason="Example of conditional skip")
-def test_conditional_feature():
-    """This test is conditionally skipped."""
-    pass
+    def test_tmp_path(self, tmp_path):
+        """Test using pytest's built-in tmp_path fixture."""
+        assert tmp_path.is_dir()
@@ -10,9 +10,14 @@ Tests the core object model classes:
 """
 import pytest
 import json
+import sys
 import uuid
 import time
 
+# Skip the whole module at collection time if laikaboss is not installed,
+# instead of paying a try/except import per test.
+objectmodel = pytest.importorskip("laikaboss.objectmodel")
+
 
 # =============================================================================
 # Test Utility Functions
@@ -21,80 +26,64 @@ import time
 class TestConvertToUTF8:
     """Tests for the convertToUTF8 function."""
 
-    @pytest.fixture
-    def convert_func(self):
-        """Import and return the convertToUTF8 function."""
-        try:
-            from laikaboss.objectmodel import convertToUTF8
-            return convertToUTF8
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
-
-    def test_bytes_to_string(self, convert_func):
-        """Test converting bytes to UTF-8 string."""
-        result = convert_func(b"hello world")
-        assert result == "hello world"
-        assert isinstance(result, str)
-
-    def test_string_passthrough(self, convert_func):
-        """Test that strings pass through unchanged."""
-        result = convert_func("hello world")
-        assert result == "hello world"
-        assert isinstance(result, str)
-
-    def test_list_conversion(self, convert_func):
-        """Test converting list of bytes to list of strings."""
-        result = convert_func([b"hello", b"world"])
-        assert result == ["hello", "world"]
-        assert all(isinstance(item, str) for item in result)
-
-    def test_tuple_conversion(self, convert_func):
-        """Test converting tuple of bytes to tuple of strings."""
-        result = convert_func((b"hello", b"world"))
-        assert result == ("hello", "world")
-        assert isinstance(result, tuple)
-
-    def test_dict_conversion(self, convert_func):
-        """Test converting dict with bytes keys/values."""
-        result = convert_func({b"key": b"value"})
-        assert result == {"key": "value"}
-
-    def test_nested_structure(self, convert_func):
-        """Test converting nested data structures."""
-        data = {
-            b"list": [b"a", b"b"],
-            b"nested": {b"key": b"value"}
-        }
-        result = convert_func(data)
-        assert result["list"] == ["a", "b"]
-        assert result["nested"]["key"] == "value"
-
-    def test_integer_passthrough(self, convert_func):
-        """Test that integers pass through unchanged."""
-        assert convert_func(42) == 42
-        assert convert_func(0) == 0
-        assert convert_func(-1) == -1
-
-    def test_float_passthrough(self, convert_func):
-        """Test that floats pass through unchanged."""
-        assert convert_func(3.14) == 3.14
-
-    def test_boolean_passthrough(self, convert_func):
+    # (input, expected) pairs; the assertion also compares exact result
+    # types, so each row pins down both the value and the container type.
+    CASES = [
+        # bytes decode to str
+        (b"hello world", "hello world"),
+        # str passes through
+        ("hello world", "hello world"),
+        # containers are converted element by element
+        ([b"hello", b"world"], ["hello", "world"]),
+        ((b"hello", b"world"), ("hello", "world")),
+        ({b"key": b"value"}, {"key": "value"}),
+        # nested structures are converted recursively
+        (
+            {b"list": [b"a", b"b"], b"nested": {b"key": b"value"}},
+            {"list": ["a", "b"], "nested": {"key": "value"}},
+        ),
+        # numbers pass through
+        (42, 42),
+        (0, 0),
+        (-1, -1),
+        (3.14, 3.14),
+    ]
+
+    @pytest.mark.parametrize("value,expected", CASES)
+    def test_conversion_table(self, value, expected):
+        """Test conversion of supported input types."""
+        result = objectmodel.convertToUTF8(value)
+        assert result == expected
+        assert type(result) is type(expected)
+
+    def test_boolean_passthrough(self):
         """Test that booleans pass through unchanged."""
-        assert convert_func(True) is True
-        assert convert_func(False) is False
+        assert objectmodel.convertToUTF8(True) is True
+        assert objectmodel.convertToUTF8(False) is False
 
-    def test_uuid_to_string(self, convert_func):
+    def test_uuid_to_string(self):
         """Test converting UUID to string."""
         test_uuid = uuid.uuid4()
-        result = convert_func(test_uuid)
+        result = objectmodel.convertToUTF8(test_uuid)
         assert result == str(test_uuid)
         assert isinstance(result, str)
 
-    def test_bytes_with_invalid_utf8(self, convert_func):
+    def test_deeply_nested_structure(self):
+        """Test nesting far beyond the recursion limit converts cleanly."""
+        depth = sys.getrecursionlimit() * 5
+        nested = b"leaf"
+        for _ in range(depth):
+            nested = [nested]
+        result = objectmodel.convertToUTF8(nested)
+        for _ in range(depth):
+            assert type(result) is list and len(result) == 1
+            result = result[0]
+        assert result == "leaf"
+
+    def test_bytes_with_invalid_utf8(self):
         """Test handling of invalid UTF-8 bytes (should use replacement char)."""
         invalid_bytes = b"\xff\xfe"
-        result = convert_func(invalid_bytes)
+        result = objectmodel.convertToUTF8(invalid_bytes)
         assert isinstance(result, str)
         # Should contain replacement characters
         assert "\ufffd" in result or result != ""
@@ -103,24 +92,10 @@ class TestConvertToUTF8:
 class TestEnsureNotUnicode:
     """Tests for the ensureNotUnicode function."""
 
-    @pytest.fixture
-    def ensure_func(self):
-        """Import and return the ensureNotUnicode function."""
-        try:
-            from laikaboss.objectmodel import ensureNotUnicode
-            return ensureNotUnicode
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
-
-    def test_string_to_bytes(self, ensure_func):
-        """Test converting string to bytes."""
-        result = ensure_func("hello")
-        assert result == b"hello"
-        assert isinstance(result, bytes)
-
-    def test_bytes_passthrough(self, ensure_func):
-        """Test that bytes pass through unchanged."""
-        result = ensure_func(b"hello")
+    @pytest.mark.parametrize("value", ["hello", b"hello"])
+    def test_returns_bytes(self, value):
+        """Test that both str and bytes input come back as bytes."""
+        result = objectmodel.ensureNotUnicode(value)
         assert result == b"hello"
         assert isinstance(result, bytes)
 
@@ -128,87 +103,41 @@ class TestEnsureNotUnicode:
 class TestEnsureBytes:
     """Tests for the ensureBytes function."""
 
-    @pytest.fixture
-    def ensure_func(self):
-        """Import and return the ensureBytes function."""
-        try:
-            from laikaboss.objectmodel import ensureBytes
-            return ensureBytes
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
-
-    def test_bytes_passthrough(self, ensure_func):
-        """Test that bytes pass through unchanged."""
-        result = ensure_func(b"hello")
-        assert result == b"hello"
-        assert isinstance(result, bytes)
-
-    def test_bytearray_to_bytes(self, ensure_func):
-        """Test converting bytearray to bytes."""
-        result = ensure_func(bytearray(b"hello"))
-        assert result == b"hello"
-        assert isinstance(result, bytes)
-
-    def test_memoryview_to_bytes(self, ensure_func):
-        """Test converting memoryview to bytes."""
-        result = ensure_func(memoryview(b"hello"))
-        assert result == b"hello"
-        assert isinstance(result, bytes)
-
-    def test_string_to_bytes(self, ensure_func):
-        """Test converting string to bytes."""
-        result = ensure_func("hello")
+    @pytest.mark.parametrize("value", [
+        b"hello",
+        bytearray(b"hello"),
+        memoryview(b"hello"),
+        "hello",
+    ])
+    def test_returns_bytes(self, value):
+        """Test that every buffer-like input type comes back as bytes."""
+        result = objectmodel.ensureBytes(value)
         assert result == b"hello"
         assert isinstance(result, bytes)
 
-    def test_invalid_type_raises(self, ensure_func):
+    @pytest.mark.parametrize("value", [12345, None])
+    def test_invalid_type_raises(self, value):
         """Test that invalid types raise an exception."""
         with pytest.raises(Exception):
-            ensure_func(12345)  # Integer should fail
-
-        with pytest.raises(Exception):
-            ensure_func(None)  # None should fail
+            objectmodel.ensureBytes(value)
 
 
 class TestCleanKey:
     """Tests for the cleanKey function."""
 
-    @pytest.fixture
-    def clean_func(self):
-        """Import and return the cleanKey function."""
-        try:
-            from laikaboss.objectmodel import cleanKey
-            return cleanKey
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
-
-    def test_removes_null_chars(self, clean_func):
-        """Test that null characters are replaced."""
-        result = clean_func("hello\0world")
-        assert "\0" not in result
-        assert result == "hello_world"
-
-    def test_removes_dots(self, clean_func):
-        """Test that dots are replaced."""
-        result = clean_func("hello.world")
-        assert "." not in result
-        assert result == "hello_world"
-
-    def test_removes_dollar(self, clean_func):
-        """Test that dollar signs are replaced."""
-        result = clean_func("hello$world")
-        assert "$" not in result
-        assert result == "hello_world"
-
-    def test_multiple_bad_chars(self, clean_func):
-        """Test replacing multiple bad characters."""
-        result = clean_func("a.b$c\0d")
-        assert result == "a_b_c_d"
-
-    def test_clean_key_unchanged(self, clean_func):
-        """Test that clean keys pass through unchanged."""
-        result = clean_func("clean_key_name")
-        assert result == "clean_key_name"
+    @pytest.mark.parametrize("key,expected", [
+        # each of the reserved characters is replaced
+        ("hello\0world", "hello_world"),
+        ("hello.world", "hello_world"),
+        ("hello$world", "hello_world"),
+        # all bad characters replaced in one pass
+        ("a.b$c\0d", "a_b_c_d"),
+        # clean keys pass through unchanged
+        ("clean_key_name", "clean_key_name"),
+    ])
+    def test_clean_key(self, key, expected):
+        """Test that reserved characters are replaced with underscores."""
+        assert objectmodel.cleanKey(key) == expected
 
 
 # =============================================================================
@@ -218,14 +147,10 @@ class TestCleanKey:
 class TestScanObject:
     """Tests for the ScanObject class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def ScanObject(self):
-        """Import and return the ScanObject class."""
-        try:
-            from laikaboss.objectmodel import ScanObject
-            return ScanObject
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
+        """Return the ScanObject class, resolved once per module."""
+        return objectmodel.ScanObject
 
     def test_basic_initialization(self, ScanObject):
         """Test basic ScanObject initialization."""
@@ -374,23 +299,15 @@ class TestScanObject:
 class TestScanResult:
     """Tests for the ScanResult class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def ScanResult(self):
-        """Import and return the ScanResult class."""
-        try:
-            from laikaboss.objectmodel import ScanResult
-            return ScanResult
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
-
-    @pytest.fixture
+        """Return the ScanResult class, resolved once per module."""
+        return objectmodel.ScanResult
+
+    @pytest.fixture(scope="module")
     def ScanObject(self):
-        """Import and return the ScanObject class."""
-        try:
-            from laikaboss.objectmodel import ScanObject
-            return ScanObject
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
+        """Return the ScanObject class, resolved once per module."""
+        return objectmodel.ScanObject
 
     def test_basic_initialization(self, ScanResult):
         """Test basic ScanResult initialization."""
@@ -443,14 +360,10 @@ class TestScanResult:
 class TestExternalVars:
     """Tests for the ExternalVars class."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def ExternalVars(self):
-        """Import and return the ExternalVars class."""
-        try:
-            from laikaboss.objectmodel import ExternalVars
-            return ExternalVars
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
+        """Return the ExternalVars class, resolved once per module."""
+        return objectmodel.ExternalVars
 
     def test_basic_initialization(self, ExternalVars):
         """Test basic ExternalVars initialization."""
@@ -536,36 +449,20 @@ class TestExceptionClasses:
 
     def test_scan_error(self):
         """Test ScanError exception."""
-        try:
-            from laikaboss.objectmodel import ScanError
-            with pytest.raises(ScanError):
-                raise ScanError("Test error")
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
+        with pytest.raises(objectmodel.ScanError):
+            raise objectmodel.ScanError("Test error")
 
     def test_quit_scan_exception(self):
         """Test QuitScanException."""
-        try:
-            from laikaboss.objectmodel import QuitScanException
-            with pytest.raises(QuitScanException):
-                raise QuitScanException("Quit scan")
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
+        with pytest.raises(objectmodel.QuitScanException):
+            raise objectmodel.QuitScanException("Quit scan")
 
     def test_global_scan_timeout_error(self):
         """Test GlobalScanTimeoutError."""
-        try:
-            from laikaboss.objectmodel import GlobalScanTimeoutError
-            with pytest.raises(GlobalScanTimeoutError):
-                raise GlobalScanTimeoutError("Timeout")
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
+        with pytest.raises(objectmodel.GlobalScanTimeoutError):
+            raise objectmodel.GlobalScanTimeoutError("Timeout")
 
     def test_global_module_timeout_error(self):
         """Test GlobalModuleTimeoutError."""
-        try:
-            from laikaboss.objectmodel import GlobalModuleTimeoutError
-            with pytest.raises(GlobalModuleTimeoutError):
-                raise GlobalModuleTimeoutError("Module timeout")
-        except ImportError:
-            pytest.skip("laikaboss.objectmodel not available")
+        with pytest.raises(objectmodel.GlobalModuleTimeoutError):
+            raise objectmodel.GlobalModuleTimeoutError("Module timeout")
@@ -16,14 +16,10 @@ import hashlib
 class TestListToSSV:
     """Tests for the listToSSV function."""
 
-    @pytest.fixture
-    def list_to_ssv(self):
-        """Import and return the listToSSV function."""
-        try:
-            from laikaboss.util import listToSSV
-            return listToSSV
-        except ImportError:
-            pytest.skip("laikaboss.util not available")
+    @pytest.fixture(scope="session")
+    def list_to_ssv(self, laikaboss_util):
+        """Return the listToSSV function, resolved once per session."""
+        return laikaboss_util.listToSSV
 
     def test_basic_list(self, list_to_ssv):
         """Test converting basic list to SSV."""
@@ -53,14 +49,10 @@ class TestListToSSV:
 class TestGetObjectHash:
     """Tests for the getObjectHash function."""
 
-    @pytest.fixture
-    def get_hash(self):
-        """Import and return the getObjectHash function."""
-        try:
-            from laikaboss.util import getObjectHash
-            return getObjectHash
-        except ImportError:
-            pytest.skip("laikaboss.util not available")
+    @pytest.fixture(scope="session")
+    def get_hash(self, laikaboss_util):
+        """Return the getObjectHash function, resolved once per session."""
+        return laikaboss_util.getObjectHash
 
     def test_basic_hash(self, get_hash):
         """Test basic hash computation."""
@@ -99,14 +91,10 @@ class TestGetObjectHash:
 class TestCleanField:
     """Tests for the clean_field function."""
 
-    @pytest.fixture
-    def clean_field(self):
-        """Import and return the clean_field function."""
-        try:
-            from laikaboss.util import clean_field
-            return clean_field
-        except ImportError:
-            pytest.skip("laikaboss.util not available")
+    @pytest.fixture(scope="session")
+    def clean_field(self, laikaboss_util):
+        """Return the clean_field function, resolved once per session."""
+        return laikaboss_util.clean_field
 
     def test_basic_string(self, clean_field):
         """Test cleaning basic string."""
@@ -156,14 +144,10 @@ class TestCleanField:
 class TestGetRandFill:
     """Tests for the getRandFill function."""
 
-    @pytest.fixture
-    def get_rand(self):
-        """Import and return the getRandFill function."""
-        try:
-            from laikaboss.util import getRandFill
-            return getRandFill
-        except ImportError:
-            pytest.skip("laikaboss.util not available")
+    @pytest.fixture(scope="session")
+    def get_rand(self, laikaboss_util):
+        """Return the getRandFill function, resolved once per session."""
+        return laikaboss_util.getRandFill
 
     def test_returns_string(self, get_rand):
         """Test that getRandFill returns a string."""
@@ -194,14 +178,10 @@ class TestGetRandFill:
 class TestGetModuleArguments:
     """Tests for the get_module_arguments function."""
 
-    @pytest.fixture
-    def get_args(self):
-        """Import and return the get_module_arguments function."""
-        try:
-            from laikaboss.util import get_module_arguments
-            return get_module_arguments
-        except ImportError:
-            pytest.skip("laikaboss.util not available")
+    @pytest.fixture(scope="session")
+    def get_args(self, laikaboss_util):
+        """Return the get_module_arguments function, resolved once per session."""
+        return laikaboss_util.get_module_arguments
 
     def test_no_arguments(self, get_args):
         """Test module with no arguments."""
@@ -237,14 +217,10 @@ class TestGetModuleArguments:
 class TestUniqueList:
     """Tests for the uniqueList function."""
 
-    @pytest.fixture
-    def unique_list(self):
-        """Import and return the uniqueList function."""
-        try:
-            from laikaboss.util import uniqueList
-            return uniqueList
-        except ImportError:
-            pytest.skip("laikaboss.util not available")
+    @pytest.fixture(scope="session")
+    def unique_list(self, laikaboss_util):
+        """Return the uniqueList function, resolved once per session."""
+        return laikaboss_util.uniqueList
 
     def test_removes_duplicates(self, unique_list):
         """Test that duplicates are removed."""
@@ -276,27 +252,29 @@ class TestUniqueList:
 # Test toBool
 # =============================================================================
 
+# Accepted spellings, built once at import and shared by the parametrized
+# tests below
+_TRUE_CASES = ("yes", "YES", "Yes", "true", "TRUE", "True", "on", "ON", "enabled", "1")
+_FALSE_CASES = ("no", "NO", "No", "false", "FALSE", "False", "off", "OFF", "disabled", "0")
+
+
 class TestToBool:
     """Tests for the toBool function."""
 
-    @pytest.fixture
-    def to_bool(self):
-        """Import and return the toBool function."""
-        try:
-            from laikaboss.util import toBool
-            return toBool
-        except ImportError:
-            pytest.skip("laikaboss.util not available")
+    @pytest.fixture(scope="session")
+    def to_bool(self, laikaboss_util):
+        """Return the toBool function, resolved once per session."""
+        return laikaboss_util.toBool
 
-    def test_true_values(self, to_bool):
+    @pytest.mark.parametrize("val", _TRUE_CASES)
+    def test_true_values(self, to_bool, val):
         """Test values that should return True."""
-        for val in ["yes", "YES", "Yes", "true", "TRUE", "True", "on", "ON", "enabled", "1"]:
-            assert to_bool(val) is True
+        assert to_bool(val) is True
 
-    def test_false_values(self, to_bool):
+    @pytest.mark.parametrize("val", _FALSE_CASES)
+    def test_false_values(self, to_bool, val):
         """Test values that should return False."""
-        for val in ["no", "NO", "No", "false", "FALSE", "False", "off", "OFF", "disabled", "0"]:
-            assert to_bool(val) is False
+        assert to_bool(val) is False
 
     def test_bool_passthrough(self, to_bool):
         """Test that booleans pass through unchanged."""
@@ -331,14 +309,10 @@ class TestToBool:
 class TestGetOption:
     """Tests for the get_option function."""
 
-    @pytest.fixture
-    def get_option(self):
-        """Import and return the get_option function."""
-        try:
-            from laikaboss.util import get_option
-            return get_option
-        except ImportError:
-            pytest.skip("laikaboss.util not available")
+    @pytest.fixture(scope="session")
+    def get_option(self, laikaboss_util):
+        """Return the get_option function, resolved once per session."""
+        return laikaboss_util.get_option
 
     def test_value_from_args(self, get_option):
         """Test getting value from arguments."""
@@ -364,69 +338,62 @@ class TestGetOption:
 # Test getRootObject and getParentObject
 # =============================================================================
 
+# Shared result graphs for the helper tests below, built once per session.
+# The consuming tests only read from them; mutating tests must build their
+# own result.
+
+@pytest.fixture(scope="session")
+def _root_only_result():
+    """ScanResult with a single root object carrying two modules' metadata."""
+    objectmodel = pytest.importorskip("laikaboss.objectmodel")
+    result = objectmodel.ScanResult()
+    root = objectmodel.ScanObject(buffer=b"root", filename="root.txt", parent="")
+    root.addMetadata("MODULE_A", "key1", "value1")
+    root.addMetadata("MODULE_B", "key2", "value2")
+    result.files["root_uid"] = root
+    result.rootUID = "root_uid"
+    return result
+
+
+@pytest.fixture(scope="session")
+def _parent_child_result():
+    """ScanResult with a parent object and one child referencing it."""
+    objectmodel = pytest.importorskip("laikaboss.objectmodel")
+    result = objectmodel.ScanResult()
+    parent = objectmodel.ScanObject(buffer=b"parent", filename="parent.txt")
+    parent.addMetadata("PARENT_MODULE", "pkey", "pvalue")
+    result.files["parent_uid"] = parent
+    child = objectmodel.ScanObject(buffer=b"child", filename="child.txt", parent="parent_uid")
+    result.files["child_uid"] = child
+    return result
+
+
 class TestResultHelpers:
     """Tests for result helper functions."""
 
-    @pytest.fixture
-    def helpers(self):
-        """Import helper functions."""
-        try:
-            from laikaboss.util import getRootObject, getParentObject
-            from laikaboss.objectmodel import ScanResult, ScanObject
-            return {
-                "getRootObject": getRootObject,
-                "getParentObject": getParentObject,
-                "ScanResult": ScanResult,
-                "ScanObject": ScanObject
-            }
-        except ImportError:
-            pytest.skip("laikaboss.util or objectmodel not available")
-
-    def test_get_root_object(self, helpers):
-        """Test getting root object from result."""
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-        getRootObject = helpers["getRootObject"]
-
-        result = ScanResult()
-        root = ScanObject(buffer=b"root", filename="root.txt")
-        result.files["root_uid"] = root
-        result.rootUID = "root_uid"
+    @pytest.fixture(scope="session")
+    def helpers(self, laikaboss_util):
+        """Return the result helper functions, resolved once per session."""
+        return {
+            "getRootObject": laikaboss_util.getRootObject,
+            "getParentObject": laikaboss_util.getParentObject,
+        }
 
-        retrieved = getRootObject(result)
+    def test_get_root_object(self, helpers, _root_only_result):
+        """Test getting root object from result."""
+        retrieved = helpers["getRootObject"](_root_only_result)
         assert retrieved.filename == "root.txt"
 
-    def test_get_parent_object(self, helpers):
+    def test_get_parent_object(self, helpers, _parent_child_result):
         """Test getting parent object."""
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-        getParentObject = helpers["getParentObject"]
-
-        result = ScanResult()
-
-        # Create parent
-        parent = ScanObject(buffer=b"parent", filename="parent.txt")
-        result.files["parent_uid"] = parent
-
-        # Create child with parent reference
-        child = ScanObject(buffer=b"child", filename="child.txt", parent="parent_uid")
-        result.files["child_uid"] = child
-
-        retrieved = getParentObject(result, child)
+        child = _parent_child_result.files["child_uid"]
+        retrieved = helpers["getParentObject"](_parent_child_result, child)
         assert retrieved.filename == "parent.txt"
 
-    def test_get_parent_of_root_returns_none(self, helpers):
+    def test_get_parent_of_root_returns_none(self, helpers, _root_only_result):
         """Test that getting parent of root returns None."""
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-        getParentObject = helpers["getParentObject"]
-
-        result = ScanResult()
-        root = ScanObject(buffer=b"root", filename="root.txt", parent="")
-        result.files["root_uid"] = root
-        result.rootUID = "root_uid"
-
-        retrieved = getParentObject(result, root)
+        root = _root_only_result.files["root_uid"]
+        retrieved = helpers["getParentObject"](_root_only_result, root)
         assert retrieved is None
 
 
@@ -437,15 +404,11 @@ class TestResultHelpers:
 class TestGetScanObjectUID:
     """Tests for get_scanObjectUID function."""
 
-    @pytest.fixture
-    def get_uid(self):
-        """Import the function."""
-        try:
-            from laikaboss.util import get_scanObjectUID
-            from laikaboss.objectmodel import ScanObject
-            return get_scanObjectUID, ScanObject
-        except ImportError:
-            pytest.skip("laikaboss.util not available")
+    @pytest.fixture(scope="session")
+    def get_uid(self, laikaboss_util):
+        """Return get_scanObjectUID and ScanObject, resolved once per session."""
+        objectmodel = pytest.importorskip("laikaboss.objectmodel")
+        return laikaboss_util.get_scanObjectUID, objectmodel.ScanObject
 
     def test_returns_uuid(self, get_uid):
         """Test that UUID is returned."""
@@ -463,67 +426,27 @@ class TestGetScanObjectUID:
 class TestMetadataHelpers:
     """Tests for metadata helper functions."""
 
-    @pytest.fixture
-    def helpers(self):
-        """Import helper functions."""
-        try:
-            from laikaboss.util import get_parent_metadata, get_root_metadata
-            from laikaboss.objectmodel import ScanResult, ScanObject
-            return {
-                "get_parent_metadata": get_parent_metadata,
-                "get_root_metadata": get_root_metadata,
-                "ScanResult": ScanResult,
-                "ScanObject": ScanObject
-            }
-        except ImportError:
-            pytest.skip("laikaboss.util not available")
-
-    def test_get_root_metadata_all(self, helpers):
+    @pytest.fixture(scope="session")
+    def helpers(self, laikaboss_util):
+        """Return the metadata helper functions, resolved once per session."""
+        return {
+            "get_parent_metadata": laikaboss_util.get_parent_metadata,
+            "get_root_metadata": laikaboss_util.get_root_metadata,
+        }
+
+    def test_get_root_metadata_all(self, helpers, _root_only_result):
         """Test getting all root metadata."""
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-        get_root_metadata = helpers["get_root_metadata"]
-
-        result = ScanResult()
-        root = ScanObject(buffer=b"root", filename="root.txt")
-        root.addMetadata("MODULE_A", "key1", "value1")
-        root.addMetadata("MODULE_B", "key2", "value2")
-        result.files["root_uid"] = root
-        result.rootUID = "root_uid"
-
-        metadata = get_root_metadata(result)
+        metadata = helpers["get_root_metadata"](_root_only_result)
         assert "MODULE_A" in metadata
         assert "MODULE_B" in metadata
 
-    def test_get_root_metadata_specific_module(self, helpers):
+    def test_get_root_metadata_specific_module(self, helpers, _root_only_result):
         """Test getting specific module metadata from root."""
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-        get_root_metadata = helpers["get_root_metadata"]
-
-        result = ScanResult()
-        root = ScanObject(buffer=b"root", filename="root.txt")
-        root.addMetadata("MODULE_A", "key1", "value1")
-        result.files["root_uid"] = root
-        result.rootUID = "root_uid"
-
-        metadata = get_root_metadata(result, "MODULE_A")
+        metadata = helpers["get_root_metadata"](_root_only_result, "MODULE_A")
         assert metadata == {"key1": "value1"}
 
-    def test_get_parent_metadata(self, helpers):
+    def test_get_parent_metadata(self, helpers, _parent_child_result):
         """Test getting parent metadata."""
-        ScanResult = helpers["ScanResult"]
-        ScanObject = helpers["ScanObject"]
-        get_parent_metadata = helpers["get_parent_metadata"]
-
-        result = ScanResult()
-
-        parent = ScanObject(buffer=b"parent", filename="parent.txt")
-        parent.addMetadata("PARENT_MODULE", "pkey", "pvalue")
-        result.files["parent_uid"] = parent
-
-        child = ScanObject(buffer=b"child", filename="child.txt", parent="parent_uid")
-        result.files["child_uid"] = child
-
-        metadata = get_parent_metadata(result, child, "PARENT_MODULE")
+        child = _parent_child_result.files["child_uid"]
+        metadata = helpers["get_parent_metadata"](_parent_child_result, child, "PARENT_MODULE")
         assert metadata == {"pkey": "pvalue"}
@@ -3,14 +3,19 @@
 Simple script to send a test email to laikamail for scanning.
 Usage: python3 send_test_email.py [host] [port]
 """
+import base64
 import smtplib
 import sys
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
-from email import encoders
 
-def send_test_email(host='localhost', port=2525):
+# Attachment payload encoded once at import; the content never changes, so
+# repeated sends (e.g. when looping this script as a load generator) skip
+# the per-call b64encode and payload round-trip of encoders.encode_base64
+_B64_TEST = base64.b64encode(b"This is a test file attachment for scanning.")
+
+def _build_test_message():
     # Create message
     msg = MIMEMultipart()
     msg['From'] = 'test@example.com'
@@ -25,24 +30,43 @@ def send_test_email(host='localhost', port=2525):
     """
     msg.attach(MIMEText(body, 'plain'))
     
-    # Optional: Add a test attachment
-    test_content = b"This is a test file attachment for scanning."
+    # Optional: Add a test attachment (payload pre-encoded at module scope)
     attachment = MIMEBase('application', 'octet-stream')
-    attachment.set_payload(test_content)
-    encoders.encode_base64(attachment)
+    attachment.set_payload(_B64_TEST)
+    attachment.add_header('Content-Transfer-Encoding', 'base64')
     attachment.add_header('Content-Disposition', 'attachment', filename='test.txt')
     msg.attach(attachment)
-    
-    # Send
+    return msg
+
+def send_test_email(host='localhost', port=2525, smtp=None):
+    msg = _build_test_message()
+
+    # Send; an existing SMTP session may be passed in to reuse the connection
     try:
-        server = smtplib.SMTP(host, port)
-        server.sendmail(msg['From'], [msg['To']], msg.as_string())
-        server.quit()
+        if smtp is not None:
+            smtp.sendmail(msg['From'], [msg['To']], msg.as_string())
+        else:
+            with smtplib.SMTP(host, port) as server:
+                server.sendmail(msg['From'], [msg['To']], msg.as_string())
         print(f"Email sent successfully to {host}:{port}")
     except Exception as e:
         print(f"Failed to send email: {e}")
         sys.exit(1)
 
+def send_many(n, host='localhost', port=2525):
+    """Send n copies of the test email over a single SMTP connection."""
+    msg = _build_test_message()
+    # The message is identical across sends; serialize it once
+    payload = msg.as_string()
+    try:
+        with smtplib.SMTP(host, port) as server:
+            for _ in range(n):
+                server.sendmail(msg['From'], [msg['To']], payload)
+        print(f"Sent {n} emails to {host}:{port}")
+    except Exception as e:
+        print(f"Failed to send emails: {e}")
+        sys.exit(1)
+
 if __name__ == '__main__':
     host = sys.argv[1] if len(sys.argv) > 1 else 'localhost'
     port = int(sys.argv[2]) if len(sys.argv) > 2 else 2525